@@ -1,18 +1,41 @@
 import json
 import os
 import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 import boto3
 from botocore.exceptions import ClientError
 
 from source.logger import get_logger
-from source.utils import get_aws_account_id
+from source.utils import AWS_REGION, get_aws_account_id, get_client
 
-AWS_REGION = "us-east-1"
+PROJECT_ARN_CACHE_TTL = 600  # seconds
+POLL_INITIAL_DELAY = 1  # seconds
+POLL_MAX_DELAY = 10  # seconds
+FAILED_JOB_STATUSES = ("ServiceError", "ClientError")
 
 logger = get_logger(__name__)
 
+# -- (project name, stage) -> (project ARN, lookup time) --
+_PROJECT_ARN_CACHE: Dict[Tuple[str, str], Tuple[str, float]] = {}
+
+
+def _load_blueprint(blueprint_name: str) -> str:
+    """Return a blueprint JSON schema as a string, re-read only when the file changes"""
+    blueprint_path = os.path.abspath(
+        os.path.join("data", "blueprints", f"{blueprint_name}.json")
+    )
+    return _read_blueprint(blueprint_path, os.stat(blueprint_path).st_mtime_ns)
+
+
+@lru_cache(maxsize=128)
+def _read_blueprint(blueprint_path: str, mtime_ns: int) -> str:
+    """Read and validate a blueprint file; mtime_ns keys the cache on file edits"""
+    with open(blueprint_path) as f:
+        return json.dumps(json.load(f))
+
 
 def create_custom_blueprint(
     blueprint_name: str, session: boto3.Session = None
@@ -29,21 +52,16 @@ def create_custom_blueprint(
 
     Raises:
         FileNotFoundError: If blueprint JSON file doesn't exist
+        json.JSONDecodeError: If blueprint JSON file is malformed
         ClientError: If AWS API call fails
     """
-    if session is None:
-        session = boto3.Session()
-
-    client = session.client("bedrock-data-automation")
-    blueprint_path = os.path.join("data", "blueprints", f"{blueprint_name}.json")
-
-    with open(blueprint_path) as f:
-        blueprint_schema = json.load(f)
+    client = get_client("bedrock-data-automation", session)
+    blueprint_schema = _load_blueprint(blueprint_name)
 
     try:
         response = client.create_blueprint(
             blueprintName=blueprint_name,
-            schema=json.dumps(blueprint_schema),
+            schema=blueprint_schema,
             type="DOCUMENT",
         )
         arn = response["blueprint"]["blueprintArn"]
@@ -52,13 +70,14 @@ def create_custom_blueprint(
     except ClientError as e:
         logger.error(f"Failed to create blueprint {blueprint_name}: {e}")
         
-def get_processing_results(invocation_arn: str, session=None) -> dict:
+def get_processing_results(invocation_arn: str, session=None, client=None) -> dict:
     """
     Get results from a Bedrock Data Automation job.
 
     Args:
         invocation_arn: ARN of the invocation to check
         session: boto3.Session object (optional, uses default if None)
+        client: bedrock-data-automation-runtime client (optional, overrides session)
 
     Returns:
         Job status and results
@@ -67,10 +86,8 @@ def get_processing_results(invocation_arn: str, session=None) -> dict:
         ClientError: If AWS API call fails
     """
     try:
-        if session is None:
-            session = boto3.Session()
-
-        client = session.client("bedrock-data-automation-runtime")
+        if client is None:
+            client = get_client("bedrock-data-automation-runtime", session)
         response = client.get_data_automation_status(invocationArn=invocation_arn)
         logger.info(f"Job status: {response.get('status', 'Unknown')}")
         return response
@@ -79,13 +96,44 @@ def get_processing_results(invocation_arn: str, session=None) -> dict:
         raise
 
 
-def search_bda_project(project_name: str, session=None) -> List[dict]:
+def _find_project_arn(
+    client, project_name: str, stage: str, use_cache: bool = False
+) -> str:
+    """
+    Find a project ARN by name, paging lazily and stopping at the first match.
+
+    With use_cache, matches are cached in memory for PROJECT_ARN_CACHE_TTL
+    seconds, so repeated lookups skip the list API. The cache is not keyed by
+    account, so only lookups through the shared default client may use it.
+    """
+    key = (project_name, stage)
+    cached = _PROJECT_ARN_CACHE.get(key) if use_cache else None
+    if cached and time.monotonic() - cached[1] < PROJECT_ARN_CACHE_TTL:
+        return cached[0]
+
+    paginator = client.get_paginator("list_data_automation_projects")
+    project_arn = next(
+        (
+            p["projectArn"]
+            for page in paginator.paginate(projectStageFilter=stage)
+            for p in page["projects"]
+            if p["projectName"] == project_name
+        ),
+        None,
+    )
+    if project_arn and use_cache:
+        _PROJECT_ARN_CACHE[key] = (project_arn, time.monotonic())
+    return project_arn
+
+
+def search_bda_project(project_name: str, session=None, client=None) -> List[dict]:
     """
     Search for BDA projects by name.
 
     Args:
         project_name: Name of the project to search for
         session: boto3.Session object (optional, uses default if None)
+        client: bedrock-data-automation client (optional, overrides session)
 
     Returns:
         List of matching projects
@@ -93,21 +141,16 @@ def search_bda_project(project_name: str, session=None) -> List[dict]:
     Raises:
         ClientError: If AWS API call fails
     """
-    if session is None:
-        session = boto3.Session()
+    # Cached ARNs belong to the shared session's account
+    use_cache = session is None and client is None
+    if client is None:
+        client = get_client("bedrock-data-automation", session)
 
     try:
-        client = session.client("bedrock-data-automation")
-        response = client.list_data_automation_projects(projectStageFilter="LIVE")
-
-        projects_arn = [
-            i["projectArn"]
-            for i in response["projects"]
-            if i["projectName"] == project_name
-        ]
-        if projects_arn:
-            logger.info(f"BDA project found: {projects_arn[0]}")
-            return projects_arn[0]
+        project_arn = _find_project_arn(client, project_name, "LIVE", use_cache)
+        if project_arn:
+            logger.info(f"BDA project found: {project_arn}")
+            return project_arn
         else:
             logger.critical(f"No BDA project found with name: {project_name}!")
             return None
@@ -138,22 +181,19 @@ def create_bda_project(
         ClientError: If AWS API call fails
     """
 
-    if session is None:
-        session = boto3.Session()
-
     if not blueprint_arns:
         raise ValueError("blueprint_arns cannot be empty")
 
+    # Cached ARNs belong to the shared session's account
+    use_cache = session is None
+    client = get_client("bedrock-data-automation", session)
+
     try:
         # Check if project exists
-        client = boto3.client("bedrock-data-automation")
-        projects = client.list_data_automation_projects(projectStageFilter=stage)[
-            "projects"
-        ]
-        existing = next((p for p in projects if p["projectName"] == project_name), None)
-        if existing:
-            logger.info(f"Using existing project: {existing['projectArn']}")
-            return existing["projectArn"]
+        existing_arn = _find_project_arn(client, project_name, stage, use_cache)
+        if existing_arn:
+            logger.info(f"Using existing project: {existing_arn}")
+            return existing_arn
     except ClientError as e:
         logger.error(f"Failed to list existing projects: {e}")
         raise
@@ -186,6 +226,11 @@ def create_bda_project(
             overrideConfiguration={"document": {"splitter": {"state": "ENABLED"}}},
         )
         project_arn = response["projectArn"]
+        if use_cache:
+            _PROJECT_ARN_CACHE[(project_name, stage)] = (
+                project_arn,
+                time.monotonic(),
+            )
         logger.info(f"Created new project: {project_arn}")
         return project_arn
     except ClientError as e:
@@ -200,6 +245,8 @@ def start_processing_job(
     stage: str = "LIVE",
     wait_for_complete: bool = False,
     session: boto3.Session = None,
+    client=None,
+    aws_account_id: str = None,
 ) -> dict:
     """
     Start async data automation processing job.
@@ -211,6 +258,8 @@ def start_processing_job(
         stage: Project stage (default: LIVE)
         wait_for_complete: wait for processing job to complete
         session: boto3.Session object (optional, uses default if None)
+        client: bedrock-data-automation-runtime client (optional, overrides session)
+        aws_account_id: AWS account ID (optional, looked up from session if None)
 
     Returns:
         Dictionary: file name and s3 URI for successfully completed jobs
@@ -219,14 +268,14 @@ def start_processing_job(
     Raises:
         ValueError: If S3 URIs are invalid
         ClientError: If AWS API call fails
+        RuntimeError: If wait_for_complete is set and the job fails
     """
 
     try:
-        if session is None:
-            session = boto3.Session()
-
-        client = session.client("bedrock-data-automation-runtime")
-        aws_account_id = get_aws_account_id(session)
+        if client is None:
+            client = get_client("bedrock-data-automation-runtime", session)
+        if aws_account_id is None:
+            aws_account_id = get_aws_account_id(session)
     except ClientError as e:
         logger.error(f"Failed to create runtime client or get account ID: {e}")
         raise
@@ -234,8 +283,8 @@ def start_processing_job(
     try:
         response = client.invoke_data_automation_async(
             dataAutomationProfileArn=f"arn:aws:bedrock:{AWS_REGION}:{aws_account_id}:data-automation-profile/us.data-automation-v1",
-            inputConfiguration={"s3Uri": os.path.join("s3://", bucket_name, file_name)},
-            outputConfiguration={"s3Uri": os.path.join("s3://", bucket_name, "output")},
+            inputConfiguration={"s3Uri": f"s3://{bucket_name}/{file_name}"},
+            outputConfiguration={"s3Uri": f"s3://{bucket_name}/output"},
             dataAutomationConfiguration={
                 "dataAutomationProjectArn": project_arn,
                 "stage": stage,
@@ -248,19 +297,86 @@ def start_processing_job(
         # -- Waiting for Status --
         if wait_for_complete:
             invocation_arn = response.get("invocationArn")
+            delay = POLL_INITIAL_DELAY
             while True:
-                result = get_processing_results(invocation_arn, session)
+                result = get_processing_results(invocation_arn, client=client)
                 status = result.get("status")
                 if status == "Success":
                     logger.info("Job Completed!")
                     output_s3_uri = result.get("outputConfiguration", {}).get("s3Uri")
                     logger.info(f"Job completed. Output available at: {output_s3_uri}")
                     return {"file": file_name, "S3_URI": output_s3_uri}
+                if status in FAILED_JOB_STATUSES:
+                    message = (
+                        f"Processing job for {file_name} failed with status {status}: "
+                        f"{result.get('errorMessage', 'Unknown error')}"
+                    )
+                    logger.error(message)
+                    raise RuntimeError(message)
                 logger.info(f"Job status: {status}")
-                time.sleep(10)
+                time.sleep(delay)
+                delay = min(delay * 2, POLL_MAX_DELAY)
 
         return response
 
     except ClientError as e:
         logger.error(f"Failed to start processing job: {e}")
         raise
+
+
+def start_processing_jobs(
+    jobs: List[Tuple[str, str]],
+    bucket_name: str,
+    stage: str = "LIVE",
+    wait_for_complete: bool = False,
+    session: boto3.Session = None,
+    max_workers: int = 10,
+) -> List[dict]:
+    """
+    Start several data automation processing jobs concurrently.
+
+    Each job is submitted via start_processing_job on a thread pool sharing
+    one runtime client, so invocations (and waits) overlap instead of
+    running back to back. The client and account ID are resolved once up
+    front, so worker threads never touch the (non thread-safe) session.
+
+    Args:
+        jobs: List of (project ARN, file name) pairs to process
+        bucket_name: S3 Bucket name for input documents and output results
+        stage: Project stage (default: LIVE)
+        wait_for_complete: wait for all processing jobs to complete
+        session: boto3.Session object (optional, uses default if None)
+        max_workers: Maximum number of jobs submitted or awaited at once
+
+    Returns:
+        List of start_processing_job results, in the same order as jobs
+
+    Raises:
+        ClientError: If any AWS API call fails
+        RuntimeError: If wait_for_complete is set and any job fails
+    """
+    if not jobs:
+        return []
+
+    try:
+        client = get_client("bedrock-data-automation-runtime", session)
+        aws_account_id = get_aws_account_id(session)
+    except ClientError as e:
+        logger.error(f"Failed to create runtime client or get account ID: {e}")
+        raise
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        futures = [
+            executor.submit(
+                start_processing_job,
+                project_arn,
+                file_name,
+                bucket_name,
+                stage=stage,
+                wait_for_complete=wait_for_complete,
+                client=client,
+                aws_account_id=aws_account_id,
+            )
+            for project_arn, file_name in jobs
+        ]
+        return [future.result() for future in futures]
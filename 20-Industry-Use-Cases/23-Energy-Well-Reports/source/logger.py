@@ -1,11 +1,13 @@
 import logging
 import logging.handlers
+import os
 import re
 import sys
 from enum import Enum
 from typing import Any, Dict
 
-LOGGING_VERBOSITY: str = "INFO"
+LOGGING_VERBOSITY: str = os.environ.get("LOG_LEVEL", "INFO")
+QUOTED_PATTERN = re.compile("`([^`]*)`")
 
 
 class LoggingLevels(Enum):
@@ -14,6 +16,7 @@ class LoggingLevels(Enum):
     NOTSET = logging.NOTSET
     ERROR = logging.ERROR
     WARN = logging.WARN
+    WARNING = logging.WARNING
     INFO = logging.INFO
     DEBUG = logging.DEBUG
     CRITICAL = logging.CRITICAL
@@ -44,6 +47,14 @@ class CustomFormatter(logging.Formatter):
         LoggingLevels.CRITICAL: bold_red,
     }
 
+    def __init__(self) -> None:
+        super().__init__()
+        # Build one formatter per level up front instead of one per record
+        self.formatters: Dict[LoggingLevels, logging.Formatter] = {
+            level: logging.Formatter(color + self.format_template + self.reset)
+            for level, color in self.COLORS.items()
+        }
+
     def format(self, record: logging.LogRecord) -> str:
         """Converts a log record to a (colored) string.
         Args:
@@ -51,15 +62,10 @@ class CustomFormatter(logging.Formatter):
         Returns:
             A string formatted according to specifications.
         """
-        log_fmt = (
-            self.COLORS[LoggingLevels(record.levelno)]
-            + self.format_template
-            + self.reset
-        )
-        formatter = logging.Formatter(log_fmt)
+        formatter = self.formatters[LoggingLevels(record.levelno)]
 
         formatted_msg = formatter.format(record)
-        quoted_groups = re.findall("`([^`]*)`", formatted_msg)
+        quoted_groups = QUOTED_PATTERN.findall(formatted_msg)
         for quoted in quoted_groups:
             formatted_msg = formatted_msg.replace(
                 "`" + quoted + "`",
@@ -98,6 +104,7 @@ def get_logger(logger_name: str) -> logging.Logger:
     """Main function to get logger name"""
     logger = logging.getLogger(logger_name)
     logger.setLevel(get_logging_level().value)
-    logger.addHandler(get_console_handler())
+    if not logger.handlers:
+        logger.addHandler(get_console_handler())
     logger.propagate = False
     return logger
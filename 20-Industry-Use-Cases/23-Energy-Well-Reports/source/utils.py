@@ -1,46 +1,133 @@
 import json
 import os
-from pathlib import Path
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 import boto3
-import pandas as pd
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from source.logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = get_logger(__name__)
 
+AWS_REGION = "us-east-1"
+PDF_SUFFIXES = (".pdf",)
+
+# -- Shared client configuration: adaptive retries, fail-fast timeouts and a
+# connection pool large enough for concurrent uploads and BDA jobs. No region
+# here: it comes from the session, so caller-supplied sessions keep theirs --
+CLIENT_CONFIG = Config(
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=10,
+)
+
+# -- Multipart settings for large report PDFs, shared by all uploads --
+MB = 1024 * 1024
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * MB,
+    multipart_chunksize=16 * MB,
+    max_concurrency=20,
+    use_threads=True,
+)
+
+# -- Shared default session, created once per process --
+_SESSION = boto3.Session(region_name=AWS_REGION)
+
+
+def get_client(service: str, session: boto3.Session = None):
+    """Return a client for service, reusing one per process for the shared session
+
+    Clients for caller-supplied sessions are not cached, so those sessions
+    are not kept alive past the call.
+    """
+    if session is not None:
+        return session.client(service, config=CLIENT_CONFIG)
+    return _shared_client(service)
 
-def get_aws_account_id(session=None) -> str:
-    """Lazy load AWS account ID"""
+
+@lru_cache(maxsize=None)
+def _shared_client(service: str):
+    """Create a client on the shared session once and reuse it afterwards"""
+    return _SESSION.client(service, config=CLIENT_CONFIG)
+
+
+def _caller_account_id(session: boto3.Session) -> str:
+    """Look up the account ID for session via its regional STS endpoint"""
+    region = session.region_name or AWS_REGION
     try:
-        if session is None:
-            session = boto3.Session()
-        return session.client("sts").get_caller_identity()["Account"]
+        sts = session.client(
+            "sts",
+            region_name=region,
+            config=CLIENT_CONFIG,
+            endpoint_url=f"https://sts.{region}.amazonaws.com",
+        )
+        return sts.get_caller_identity()["Account"]
     except ClientError as e:
         logger.critical(f"Failed to get AWS account ID: {e}")
         raise
 
 
-def upload_data_to_s3(bucket_name, local_data_dir="data/reports", session=None):
+@lru_cache(maxsize=None)
+def _shared_account_id() -> str:
+    """Account ID of the shared session, looked up once per process"""
+    return _caller_account_id(_SESSION)
+
+
+def get_aws_account_id(session=None) -> str:
+    """Lazy load AWS account ID (cached for the shared default session)"""
+    if session is None:
+        return _shared_account_id()
+    return _caller_account_id(session)
+
+
+def upload_data_to_s3(
+    bucket_name,
+    local_data_dir="data/reports",
+    session=None,
+    transfer_config=UPLOAD_TRANSFER_CONFIG,
+):
     """Upload files from local directory to S3 bucket.
 
+    All files are queued on a single transfer manager, so multipart parts
+    and whole files share one bounded thread and buffer pool.
+
     Args:
         bucket_name: S3 bucket name
         data_dir: Local directory path
         session: boto3.Session object (optional, uses default if None)
-    """
-    if session is None:
-        session = boto3.Session()
+        transfer_config: boto3 TransferConfig for concurrency and multipart sizes
 
-    s3 = session.client("s3")
-
-    for file_path in Path(local_data_dir).iterdir():
-        if file_path.is_file():
-            s3.upload_file(
-                str(file_path), bucket_name, os.path.join("reports", file_path.name)
-            )
-            logger.info(f"Uploaded {file_path.name}")
+    Raises:
+        S3UploadFailedError: If any upload fails (same as s3.upload_file)
+    """
+    s3 = get_client("s3", session)
+    # DirEntry caches the file type from the directory read, avoiding a stat
+    with os.scandir(local_data_dir) as entries:
+        files = [entry for entry in entries if entry.is_file()]
+
+    with create_transfer_manager(s3, transfer_config) as manager:
+        uploads = [
+            (entry, manager.upload(entry.path, bucket_name, f"reports/{entry.name}"))
+            for entry in files
+        ]
+        for entry, future in uploads:
+            try:
+                future.result()
+            except ClientError as e:
+                raise S3UploadFailedError(
+                    f"Failed to upload {entry.path} to "
+                    f"{bucket_name}/reports/{entry.name}: {e}"
+                ) from e
+            logger.info(f"Uploaded {entry.name}")
 
 
 def list_s3_files(bucket, prefix, session=None):
@@ -54,15 +141,16 @@ def list_s3_files(bucket, prefix, session=None):
     Returns:
         List of PDF file keys
     """
-    if session is None:
-        session = boto3.Session()
-
-    s3 = session.client("s3")
-    response = s3.list_objects_v2(Bucket=bucket, Prefix=prefix)
+    s3 = get_client("s3", session)
+    paginator = s3.get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=bucket, Prefix=prefix, PaginationConfig={"PageSize": 1000}
+    )
     files = [
         obj["Key"]
-        for obj in response.get("Contents", [])
-        if obj["Key"].endswith(".pdf")
+        for page in pages
+        for obj in page.get("Contents", [])
+        if obj["Key"].endswith(PDF_SUFFIXES)
     ]
     return files
 
@@ -77,21 +165,18 @@ def get_s3_to_dict(s3_url: str, session=None) -> dict:
     Returns:
         Parsed JSON content as dictionary
     """
-    if session is None:
-        session = boto3.Session()
-
-    s3 = session.client("s3")
+    s3 = get_client("s3", session)
 
-    bucket_name = s3_url.split("/")[2]
-    object_key = "/".join(s3_url.split("/")[3:])
+    # Keys may legally contain "#" and "?", so avoid URL parsing semantics
+    bucket_name, _, object_key = s3_url.removeprefix("s3://").partition("/")
 
     response = s3.get_object(Bucket=bucket_name, Key=object_key)
-    json_content = response["Body"].read().decode("utf-8")
 
-    return json.loads(json_content)
+    # json.loads accepts bytes directly, skipping an intermediate str copy
+    return json.loads(response["Body"].read())
 
 
-def get_dataframe(data: dict, field: str) -> pd.DataFrame:
+def get_dataframe(data: dict, field: str) -> "pd.DataFrame":
     """Extract field from inference result and convert to DataFrame.
 
     Args:
@@ -101,18 +186,27 @@ def get_dataframe(data: dict, field: str) -> pd.DataFrame:
     Returns:
         DataFrame containing the specified field data
     """
+    # pandas is only needed for display, so it is imported on first use
+    import pandas as pd
+
     return pd.DataFrame(data["inference_result"][field])
 
 
-def get_custom_output_path(meta_data_path: str) -> str:
+def get_custom_output_path(meta_data_path: str, session=None) -> list:
     """Extract custom output path from metadata JSON file.
 
     Args:
-        meta_data_path: Path to metadata JSON file
+        meta_data_path: S3 URI or local path to metadata JSON file
+        session: boto3.Session object (optional, uses default if None)
 
     Returns:
-        Custom output path from segment metadata
+        Custom output paths from segment metadata of the first asset
     """
-    meta = pd.read_json(meta_data_path).loc[0]
-    paths = [p["custom_output_path"] for p in meta["output_metadata"]["segment_metadata"]]
-    return paths
+    if meta_data_path.startswith("s3://"):
+        meta = get_s3_to_dict(meta_data_path, session)
+    else:
+        with open(meta_data_path) as f:
+            meta = json.load(f)
+
+    segments = meta["output_metadata"][0]["segment_metadata"]
+    return [p["custom_output_path"] for p in segments]